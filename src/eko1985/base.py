@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional, TYPE_CHECKING
 
 from .enums import Trädslag
 from .utils import qmd_cm
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class EvenAgedStand:
     """Minimal helpers shared by all stand components."""
 
+    __slots__ = ()
+
     @staticmethod
     def getQMD(BA: float, stems: float) -> float:
         return qmd_cm(BA, stems)
@@ -24,10 +26,14 @@ class EvenAgedStand:
         return volume / total_age
 
 
-@dataclass
+@dataclass(slots=True)
 class EkoStandPart(EvenAgedStand):
     """Common state for every species-specific cohort."""
 
+    # Species labels as used in the Excel sheets and in replay snapshots
+    swe_name: ClassVar[str | None] = None
+    eng_name: ClassVar[str | None] = None
+
     BA: float
     stems: float
     age: float
@@ -38,12 +44,22 @@ class EkoStandPart(EvenAgedStand):
     ba_quotient_acute_mortality: float = 0.0
     QMD: float = 0.0
     HK: float = 0.0
+    # Filled in by the stand's growth and volume passes
+    BAI5: float = field(default=0.0, init=False, repr=False)
+    VOL: float = field(default=0.0, init=False, repr=False)
+    VOL0: float = field(default=0.0, init=False, repr=False)
+    volume_increment: float = field(default=0.0, init=False, repr=False)
+    gross_volume_increment: float = field(default=0.0, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.BA = float(self.BA)
-        self.stems = float(self.stems)
-        self.age = float(self.age)
-        self.QMD = self.getQMD(self.BA, self.stems)
+        # Inputs are usually floats already; only coerce the ones that are not
+        if type(self.BA) is not float:
+            self.BA = float(self.BA)
+        if type(self.stems) is not float:
+            self.stems = float(self.stems)
+        if type(self.age) is not float:
+            self.age = float(self.age)
+        self.QMD = qmd_cm(self.BA, self.stems)
 
     def register_stand(self, stand: "EkoStand") -> None:
         self.stand = stand
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
-from typing import Sequence
 import bisect
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -30,6 +30,17 @@ class CarbonnierHeightModel:
     ages: Sequence[float]
     a_vals: Sequence[float]
     b_vals: Sequence[float]
+    # Position of each tabulated age, for the τ reference-age lookup
+    _age_to_idx: dict[float, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._age_to_idx = {}
+        for i, age in enumerate(self.ages):
+            self._age_to_idx.setdefault(age, i)
+
+    def _bracket(self, age: float) -> int:
+        """Index ``i`` with ``ages[i - 1] < age <= ages[i]`` (bisect_left)."""
+        return bisect.bisect_left(self.ages, age)
 
     # ------------------------------------------------------------------
     # τ (tau) calculation
@@ -40,9 +51,13 @@ class CarbonnierHeightModel:
 
         τ = (SI - a_si_age) / b_si_age
         """
-        try:
-            idx = self.ages.index(si_age)
-        except ValueError:
+        a_si, b_si = self._si_coefficients(si_age)
+        return (site_index - a_si) / b_si
+
+    def _si_coefficients(self, si_age: float) -> tuple[float, float]:
+        """Return ``(a, b)`` at the reference age ``si_age``."""
+        idx = self._age_to_idx.get(si_age)
+        if idx is None:
             raise ValueError(f"si_age={si_age} not found in ages grid {self.ages}")
 
         a_si = self.a_vals[idx]
@@ -53,7 +68,7 @@ class CarbonnierHeightModel:
                 "b coefficient at si_age is zero; cannot compute tau."
             )
 
-        return (site_index - a_si) / b_si
+        return a_si, b_si
 
     # ------------------------------------------------------------------
     # Height for a given age and τ
@@ -66,17 +81,16 @@ class CarbonnierHeightModel:
         Otherwise, linear interpolation is applied between the nearest
         age classes.
         """
+        # Locate surrounding ages
+        i = self._bracket(age)
+
         # Exact match
-        if age in self.ages:
-            i = self.ages.index(age)
+        if i < len(self.ages) and self.ages[i] == age:
             return self.a_vals[i] + tau * self.b_vals[i]
 
         if not interpolate:
             raise ValueError("Age not tabulated and interpolate=False.")
 
-        # Locate surrounding ages
-        i = bisect.bisect_left(self.ages, age)
-
         if i == 0 or i == len(self.ages):
             raise ValueError(
                 f"Age {age} outside coefficient range [{self.ages[0]}, {self.ages[-1]}]."
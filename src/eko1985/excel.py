@@ -2,31 +2,41 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+import copy
+import hashlib
+import json
 import math
 import os
 import posixpath
-from typing import Iterable, List, Sequence, overload
+import sys
+from typing import IO, Iterable, List, Sequence, overload
 import xml.etree.ElementTree as ET
 from zipfile import ZipFile
 
+try:  # optional: faster encode/decode of the parse cache
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
 
 class _SheetRow:
     """Lightweight row proxy exposing a tiny pandas-compatible surface."""
 
     def __init__(self, values: Sequence[object], width: int) -> None:
-        self._values = list(values)
+        # ``values`` is a sheet row already padded to ``width``; not copied
+        self._values = values
         self._width = width
 
     def __getitem__(self, index: int) -> object:
         if index < 0 or index >= self._width:
             raise IndexError(index)
-        if index < len(self._values):
-            return self._values[index]
-        return None
+        return self._values[index]
 
     def tolist(self) -> list[object]:
-        return [self[i] for i in range(self._width)]
+        return list(self._values[: self._width])
 
 
 class _ILocAccessor:
@@ -57,8 +67,14 @@ class _Sheet:
 
     def __init__(self, rows: Iterable[Sequence[object]]) -> None:
         materialized_rows: List[List[object]] = [list(row) for row in rows]
+        width = max((len(row) for row in materialized_rows), default=0)
+        # Pad once so every row is ``width`` long and cell reads need no
+        # per-access length checks
+        for row in materialized_rows:
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
         self._rows = materialized_rows
-        self._width = max((len(row) for row in materialized_rows), default=0)
+        self._width = width
         self.iloc = _ILocAccessor(self)
 
     @property
@@ -78,13 +94,19 @@ class _Sheet:
             raise IndexError(row)
         if col < 0:
             raise IndexError(col)
-        if col < len(self._rows[row]):
+        if col < self._width:
             return self._rows[row][col]
         return None
 
     def iat(self, row: int, col: int) -> object:
         return self._get_value(row, col)
 
+    def tolist(self, min_width: int = 0) -> list[list[object]]:
+        """Return the cells as rectangular rows padded with ``None``."""
+
+        pad = [None] * max(min_width - self._width, 0)
+        return [row + pad for row in self._rows]
+
 
 def _is_na(value: object) -> bool:
     if value is None:
@@ -95,6 +117,11 @@ def _is_na(value: object) -> bool:
 
 
 def _to_num(x):
+    # Fast path: numeric cells already arrive as floats, and blanks as None
+    if type(x) is float:
+        return None if math.isnan(x) else x
+    if x is None:
+        return None
     try:
         if _is_na(x):
             return None
@@ -120,10 +147,27 @@ _MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
 _REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 _PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 
+_ROW_TAG = f"{{{_MAIN_NS}}}row"
+_CELL_TAG = f"{{{_MAIN_NS}}}c"
+_VALUE_TAG = f"{{{_MAIN_NS}}}v"
+_TEXT_TAG = f"{{{_MAIN_NS}}}t"
+_SHEET_DATA_TAG = f"{{{_MAIN_NS}}}sheetData"
+_SHARED_STRING_TAG = f"{{{_MAIN_NS}}}si"
+_SHEETS_PATH = f"{{{_MAIN_NS}}}sheets/{{{_MAIN_NS}}}sheet"
+_RELATIONSHIP_TAG = f"{{{_PKG_REL_NS}}}Relationship"
+_REL_ID_ATTR = f"{{{_REL_NS}}}id"
+
 
 def _column_index_from_ref(ref: str) -> int:
+    # Cell refs are column letters followed by the row number; the letters
+    # repeat down every row, so only they are converted (and cached).
+    return _column_index_from_letters(ref.rstrip("0123456789"))
+
+
+@lru_cache(maxsize=4096)
+def _column_index_from_letters(letters: str) -> int:
     col = 0
-    for ch in ref:
+    for ch in letters:
         if ch.isalpha():
             col = col * 26 + (ord(ch.upper()) - ord("A") + 1)
         else:
@@ -133,15 +177,19 @@ def _column_index_from_ref(ref: str) -> int:
 
 def _read_shared_strings(zf: ZipFile) -> list[str]:
     try:
-        data = zf.read("xl/sharedStrings.xml")
+        stream = zf.open("xl/sharedStrings.xml")
     except KeyError:
         return []
-    tree = ET.fromstring(data)
-    ns = {"main": _MAIN_NS}
+    # Streamed and interned: labels such as "Tall" or "Gallring" repeat
+    # throughout the table and are compared over and over by the parsers.
     strings: list[str] = []
-    for si in tree.findall("main:si", ns):
-        parts = [t.text or "" for t in si.findall(".//main:t", ns)]
-        strings.append("".join(parts))
+    with stream:
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag != _SHARED_STRING_TAG:
+                continue
+            text = "".join(t.text or "" for t in elem.iter(_TEXT_TAG))
+            strings.append(sys.intern(text))
+            elem.clear()
     return strings
 
 
@@ -150,7 +198,7 @@ def _read_sheet_targets(zf: ZipFile) -> dict[str, str]:
     relationships = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
 
     rel_map = {}
-    for rel in relationships.findall(f"{{{_PKG_REL_NS}}}Relationship"):
+    for rel in relationships.findall(_RELATIONSHIP_TAG):
         rel_id = rel.get("Id")
         target = rel.get("Target")
         if rel_id and target:
@@ -160,72 +208,104 @@ def _read_sheet_targets(zf: ZipFile) -> dict[str, str]:
                 rel_map[rel_id] = posixpath.normpath(posixpath.join("xl", target))
 
     sheets = {}
-    ns = {"main": _MAIN_NS, "rel": _REL_NS}
-    for sheet in workbook.findall("main:sheets/main:sheet", ns):
+    for sheet in workbook.findall(_SHEETS_PATH):
         name = sheet.get("name")
-        rel_id = sheet.get(f"{{{_REL_NS}}}id")
+        rel_id = sheet.get(_REL_ID_ATTR)
         if name and rel_id and rel_id in rel_map:
             sheets[name] = rel_map[rel_id]
     return sheets
 
 
-def _read_cell_value(
-    cell: ET.Element, shared_strings: list[str], ns: dict[str, str]
-) -> object:
+def _read_cell_value(cell: ET.Element, shared_strings: list[str]) -> object:
     cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(_TEXT_TAG))
+    value = cell.find(_VALUE_TAG)
+    text = value.text if value is not None else None
+    if text is None:
+        return None
     if cell_type == "s":
-        value = cell.find("main:v", ns)
-        if value is None or value.text is None:
-            return None
-        idx = int(value.text)
+        idx = int(text)
         return shared_strings[idx] if 0 <= idx < len(shared_strings) else None
     if cell_type == "b":
-        value = cell.find("main:v", ns)
-        return (
-            value.text == "1" if value is not None and value.text is not None else None
-        )
-    if cell_type == "inlineStr":
-        parts = [t.text or "" for t in cell.findall(".//main:t", ns)]
-        return "".join(parts)
-    value = cell.find("main:v", ns)
-    if value is None or value.text is None:
-        return None
+        return text == "1"
     if cell_type == "str":
-        return value.text
+        return text
     try:
-        return float(value.text)
+        return float(text)
     except (TypeError, ValueError):
-        return value.text
+        return text
 
 
-def _extract_sheet_rows(data: bytes, shared_strings: list[str]) -> list[list[object]]:
-    ns = {"main": _MAIN_NS}
-    sheet = ET.fromstring(data)
+def _extract_sheet_rows(
+    source: IO[bytes], shared_strings: list[str]
+) -> list[list[object]]:
+    """Return the ``<row>`` elements of a worksheet as lists of cell values.
+
+    Rows are kept in document order without re-inserting the rows Excel
+    omits, and empty cells are ``None``. The sheet parsers below locate values
+    relative to their labels on that layout, which is why third-party readers
+    (pandas/openpyxl, calamine) that expand to the absolute row grid and use
+    ``""`` for blanks are not drop-in replacements here.
+
+    ``source`` is read incrementally (e.g. straight from the zip member) and
+    each finished row is dropped from the tree, so neither the decompressed
+    XML nor its full element tree is ever held in memory.
+    """
+
     rows: list[list[object]] = []
-    for row in sheet.findall("main:sheetData/main:row", ns):
+    sheet_data: ET.Element | None = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if elem.tag == _SHEET_DATA_TAG:
+                sheet_data = elem
+            continue
+        if elem.tag != _ROW_TAG:
+            continue
         current: list[object] = []
         last_col = -1
-        for cell in row.findall("main:c", ns):
+        for cell in elem:
+            if cell.tag != _CELL_TAG:
+                continue
             ref = cell.get("r")
-            col_idx = _column_index_from_ref(ref or "") if ref else last_col + 1
+            col_idx = _column_index_from_ref(ref) if ref else last_col + 1
             while len(current) <= col_idx:
                 current.append(None)
-            current[col_idx] = _read_cell_value(cell, shared_strings, ns)
+            current[col_idx] = _read_cell_value(cell, shared_strings)
             last_col = col_idx
         rows.append(current)
+        if sheet_data is not None:
+            sheet_data.clear()
     return rows
 
 
-def _load_sheet(xlsx_path: Path, sheet_name: str) -> _Sheet:
+def _load_sheets(
+    xlsx_path: Path, sheet_names: Sequence[str], optional: Sequence[str] = ()
+) -> dict[str, _Sheet]:
+    """Load ``sheet_names`` from one pass over the workbook archive.
+
+    The shared strings and sheet relationships are read once and reused for
+    every requested sheet. Sheets missing from the workbook are omitted from
+    the result, as are ``optional`` sheets that cannot be read.
+    """
+
+    sheets: dict[str, _Sheet] = {}
     with ZipFile(xlsx_path) as zf:
         shared_strings = _read_shared_strings(zf)
         targets = _read_sheet_targets(zf)
-        try:
-            sheet_path = targets[sheet_name]
-        except KeyError as exc:  # pragma: no cover - invalid input guard
-            raise KeyError(f"sheet '{sheet_name}' not found") from exc
-        rows = _extract_sheet_rows(zf.read(sheet_path), shared_strings)
-    return _Sheet(rows)
+        for sheet_name in sheet_names:
+            sheet_path = targets.get(sheet_name)
+            if sheet_path is None:
+                continue
+            try:
+                with zf.open(sheet_path) as stream:
+                    rows = _extract_sheet_rows(stream, shared_strings)
+            except Exception:
+                if sheet_name not in optional:
+                    raise
+                continue
+            sheets[sheet_name] = _Sheet(rows)
+    return sheets
 
 
 # ----------------------------- #
@@ -233,6 +313,30 @@ def _load_sheet(xlsx_path: Path, sheet_name: str) -> _Sheet:
 # ----------------------------- #
 
 
+def _find_labels(sheet: _Sheet, labels: Iterable[str]) -> dict[str, tuple[int, int]]:
+    """Locate ``labels`` in ``sheet`` with a single scan over its cells.
+
+    Matching is case-insensitive on the stripped cell text. Positions are keyed
+    by the lower-cased label and the first match in row-major order wins; the
+    scan stops as soon as every label has been found.
+    """
+
+    remaining = {label.lower() for label in labels}
+    positions: dict[str, tuple[int, int]] = {}
+    for i, row in enumerate(sheet._rows):
+        for j, value in enumerate(row):
+            # Labels are text; numbers and blanks can never match
+            if not isinstance(value, str):
+                continue
+            key = value.strip().lower()
+            if key in remaining:
+                positions[key] = (i, j)
+                remaining.discard(key)
+                if not remaining:
+                    return positions
+    return positions
+
+
 def _parse_site_variables(sheet: _Sheet) -> dict:
     """
     Reads the 'Site Variables' sheet and extracts:
@@ -241,17 +345,24 @@ def _parse_site_variables(sheet: _Sheet) -> dict:
       - H100 per species from 'Ståndortsindex, dm' (converted to meters: dm/10).
     """
 
-    def find(label):
-        for i in range(sheet.shape[0]):
-            for j in range(sheet.shape[1]):
-                if str(sheet.iat(i, j)).strip().lower() == label.lower():
-                    return (i, j)
-        return None
+    positions = _find_labels(
+        sheet,
+        (
+            "Latitud",
+            "Altitud",
+            "Område",
+            "Torr",
+            "Våt",
+            "Ört/gräs",
+            "Blåbär/lingon",
+            "Ståndortsindex, dm",
+        ),
+    )
 
     # Geographic
-    lat_pos = find("Latitud")
-    alt_pos = find("Altitud")
-    omr_pos = find("Område")
+    lat_pos = positions.get("latitud")
+    alt_pos = positions.get("altitud")
+    omr_pos = positions.get("område")
     lat = _to_num(sheet.iat(lat_pos[0] + 1, lat_pos[1])) if lat_pos else None
     alt = _to_num(sheet.iat(alt_pos[0] + 1, alt_pos[1])) if alt_pos else None
     region_raw = _to_str(sheet.iat(omr_pos[0] + 1, omr_pos[1])) if omr_pos else None
@@ -270,8 +381,8 @@ def _parse_site_variables(sheet: _Sheet) -> dict:
     region = region_map.get(region_raw or "", None)
 
     # Soil moisture (very simple mapping)
-    torr_pos = find("Torr")
-    vat_pos = find("Våt")
+    torr_pos = positions.get("torr")
+    vat_pos = positions.get("våt")
     soil_code = 3
     if torr_pos and _to_str(sheet.iat(torr_pos[0] + 1, torr_pos[1])) in (
         "Ja",
@@ -287,8 +398,8 @@ def _parse_site_variables(sheet: _Sheet) -> dict:
         soil_code = 5
 
     # Vegetation (very simple mapping)
-    ort_pos = find("Ört/gräs")
-    blabar_pos = find("Blåbär/lingon")
+    ort_pos = positions.get("ört/gräs")
+    blabar_pos = positions.get("blåbär/lingon")
     veg_code = None
     if ort_pos and _to_str(sheet.iat(ort_pos[0] + 1, ort_pos[1])) in (
         "Ja",
@@ -304,11 +415,12 @@ def _parse_site_variables(sheet: _Sheet) -> dict:
         veg_code = 13
 
     # H100 site indices (dm → m)
-    si_label = find("Ståndortsindex, dm")
+    si_label = positions.get("ståndortsindex, dm")
     H100 = {}
     if si_label:
-        species_row = sheet.iloc[si_label[0] + 1].tolist()
-        values_row = sheet.iloc[si_label[0] + 2].tolist()
+        # Raw rows: cells past either row's end would be blanks and skipped
+        species_row = sheet._rows[si_label[0] + 1]
+        values_row = sheet._rows[si_label[0] + 2]
         for name, val in zip(species_row, values_row):
             if _is_na(name) or _is_na(val):
                 continue
@@ -336,17 +448,19 @@ def _parse_general_sheet(sheet: _Sheet) -> list[dict]:
       - 'after' state (Stamantal st/ha, Grundyta m2/ha, Dg cm, Volym m3sk/ha)
       - extraction (Uttag/självgallring), growth (Årlig tillväxt), and mortality flags
     """
+    # Materialise the cells once; columns up to 22 are always addressable
+    vals = sheet.tolist(min_width=23)
     events_idx = [
-        i
-        for i in range(len(sheet))
-        if sheet.iloc[i, 1] in ("Start", "Tillväxt", "Gallring")
+        i for i, row in enumerate(vals) if row[1] in ("Start", "Tillväxt", "Gallring")
     ]
+    # Each block ends where the next event label starts (or at the sheet end)
+    boundaries = events_idx[1:] + [len(vals)]
     species_order = ["Tall", "Gran", "Björk", "Bok", "Ek", "Öv.löv"]
 
     events: list[dict] = []
-    for ei, i in enumerate(events_idx):
-        typ = sheet.iloc[i, 1]
-        period_raw = sheet.iloc[i, 0]
+    for ei, (i, next_boundary) in enumerate(zip(events_idx, boundaries)):
+        typ = vals[i][1]
+        period_raw = vals[i][0]
         if isinstance(period_raw, (int, float, str)):
             try:
                 period = int(period_raw)
@@ -358,43 +472,61 @@ def _parse_general_sheet(sheet: _Sheet) -> list[dict]:
             period = ei if typ == "Start" else (events[-1]["period"] + 1 if events else 0)
 
         # species rows for a block can start 1 row above the event label in some exports (e.g., 'Tall' above 'Start')
-        next_boundary = next((idx for idx in events_idx if idx > i), len(sheet))
         species_block = {}
-        k = max(0, i - 1)
-        while k < next_boundary:
-            sp = sheet.iloc[k, 2]
+        for k in range(max(0, i - 1), next_boundary):
+            row = vals[k]
+            sp = row[2]
             if sp in species_order:
+                # Coerce the numeric block (columns 3-19) of the row in one pass
+                (
+                    total_age,
+                    bh_age,
+                    h_top_m,
+                    after_N,
+                    after_BA,
+                    after_QMD,
+                    after_VOL,
+                    _,
+                    out_N,
+                    out_BA,
+                    out_QMD,
+                    out_VOL,
+                    _,
+                    lopande,
+                    medel,
+                    slow_frac,
+                    fast_frac,
+                ) = map(_to_num, row[3:20])
                 species_block[sp] = {
-                    "total_age": _to_num(sheet.iloc[k, 3]),
-                    "bh_age": _to_num(sheet.iloc[k, 4]),
-                    "h_top_m": _to_num(sheet.iloc[k, 5]),
+                    "total_age": total_age,
+                    "bh_age": bh_age,
+                    "h_top_m": h_top_m,
                     "after": {
-                        "N_stems_ha": _to_num(sheet.iloc[k, 6]),
-                        "BA_m2_ha": _to_num(sheet.iloc[k, 7]),
-                        "QMD_cm": _to_num(sheet.iloc[k, 8]),
-                        "VOL_m3sk_ha": _to_num(sheet.iloc[k, 9]),
+                        "N_stems_ha": after_N,
+                        "BA_m2_ha": after_BA,
+                        "QMD_cm": after_QMD,
+                        "VOL_m3sk_ha": after_VOL,
                     },
                     "extraction": {
-                        "N_stems_ha": _to_num(sheet.iloc[k, 11]),
-                        "BA_m2_ha": _to_num(sheet.iloc[k, 12]),
-                        "QMD_cm": _to_num(sheet.iloc[k, 13]),
-                        "VOL_m3sk_ha": _to_num(sheet.iloc[k, 14]),
+                        "N_stems_ha": out_N,
+                        "BA_m2_ha": out_BA,
+                        "QMD_cm": out_QMD,
+                        "VOL_m3sk_ha": out_VOL,
                     },
                     "growth": {
-                        "lopande_m3sk_ha": _to_num(sheet.iloc[k, 16]),
-                        "medel_m3sk_ha": _to_num(sheet.iloc[k, 17]),
+                        "lopande_m3sk_ha": lopande,
+                        "medel_m3sk_ha": medel,
                     },
                     "mortality": {
-                        "slow_BA_frac": _to_num(sheet.iloc[k, 18]),
-                        "fast_BA_frac": _to_num(sheet.iloc[k, 19]),
+                        "slow_BA_frac": slow_frac,
+                        "fast_BA_frac": fast_frac,
                     },
                     "flags": {
-                        "nygallara": _to_str(sheet.iloc[k, 20]),
-                        "gallrad_nagongang": _to_str(sheet.iloc[k, 21]),
-                        "gallringshistorik": _to_str(sheet.iloc[k, 22]),
+                        "nygallara": _to_str(row[20]),
+                        "gallrad_nagongang": _to_str(row[21]),
+                        "gallringshistorik": _to_str(row[22]),
                     },
                 }
-            k += 1
 
         events.append({"period": period, "type": typ, "species": species_block})
 
@@ -416,8 +548,9 @@ def _parse_oversight_extractions(
     gallrings: list[dict[str, dict[str, float | None]]] = []
     current: dict[str, dict[str, float | None]] | None = None
 
-    for i in range(len(sheet)):
-        label = sheet.iloc[i, 0]
+    # As in _parse_general_sheet: read padded rows instead of per-cell iloc
+    for row in sheet.tolist(min_width=5):
+        label = row[0]
         if isinstance(label, str) and label.startswith("Gallring"):
             current = {}
             gallrings.append(current)
@@ -431,10 +564,7 @@ def _parse_oversight_extractions(
 
         if label in species_order:
             # Columns (by observation): [species, age, N, BA, VOL, ...]
-            age = _to_num(sheet.iloc[i, 1])
-            stems = _to_num(sheet.iloc[i, 2])
-            ba = _to_num(sheet.iloc[i, 3])
-            vol = _to_num(sheet.iloc[i, 4])
+            age, stems, ba, vol = map(_to_num, row[1:5])
             current[label] = {
                 "total_age": age,
                 "N_stems_ha": stems,
@@ -459,21 +589,99 @@ def _resolve_workbook_path(path: Path) -> Path:
     raise FileNotFoundError(path)
 
 
-def excel_to_json(xlsx_path: str) -> dict:
-    """
-    High-level: parse the Excel and return a single, tidy structure.
+# Sheets read from every workbook; 'Oversight' is only present in some exports
+_REQUIRED_SHEETS = ("Site Variables", "General")
+_OPTIONAL_SHEETS = ("Oversight",)
+
+
+# Recent parses kept in memory, keyed by the workbook's content digest
+_PARSE_MEMO: OrderedDict[str, dict] = OrderedDict()
+_PARSE_MEMO_SIZE = 16
+
+
+def _parse_workbook_memoised(path: Path, xlsx_path: str, digest: str) -> dict:
+    """``_parse_workbook`` reusing an in-memory parse of identical contents.
+
+    Callers always receive their own deep copy, so mutating a result never
+    leaks into later calls.
     """
-    original_path = Path(xlsx_path)
-    path = _resolve_workbook_path(original_path)
-    site_sheet = _load_sheet(path, "Site Variables")
-    general_sheet = _load_sheet(path, "General")
+
+    memoised = _PARSE_MEMO.get(digest)
+    if memoised is not None:
+        _PARSE_MEMO.move_to_end(digest)
+        result = copy.deepcopy(memoised)
+        result["source_file"] = os.path.basename(xlsx_path)
+        return result
+
+    result = _parse_workbook(path, xlsx_path)
+    _PARSE_MEMO[digest] = copy.deepcopy(result)
+    if len(_PARSE_MEMO) > _PARSE_MEMO_SIZE:
+        _PARSE_MEMO.popitem(last=False)
+    return result
+
+
+# Bump whenever the parsed structure changes, so older cache files are ignored
+_PARSE_CACHE_VERSION = 1
+
+
+def _workbook_digest(path: Path) -> str:
+    """Content hash keying cached parses of the workbook at ``path``."""
+
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _read_cached_parse(cache_path: Path) -> dict | None:
+    try:
+        raw = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _write_cached_parse(cache_path: Path, result: dict) -> None:
+    """Store ``result`` at ``cache_path``; best effort, failures are ignored."""
+
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        if orjson is not None:
+            raw = orjson.dumps(result)
+        else:
+            raw = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Unserialisable result, or a read-only or full cache directory: the
+        # parse itself succeeded
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _parse_workbook(path: Path, xlsx_path: str) -> dict:
+    """Parse the workbook at ``path`` into the structure of ``excel_to_json``."""
+
+    sheets = _load_sheets(
+        path, _REQUIRED_SHEETS + _OPTIONAL_SHEETS, optional=_OPTIONAL_SHEETS
+    )
+    for required in _REQUIRED_SHEETS:
+        if required not in sheets:  # pragma: no cover - invalid input guard
+            raise KeyError(f"sheet '{required}' not found")
+    site_sheet = sheets["Site Variables"]
+    general_sheet = sheets["General"]
     # Prefer explicit thinning removals from 'Oversight' when present; fall
     # back to the 'General' extraction columns otherwise.
-    try:
-        oversight_sheet = _load_sheet(path, "Oversight")
-        oversight_extractions = _parse_oversight_extractions(oversight_sheet)
-    except Exception:
-        oversight_extractions = []
+    oversight_extractions: list[dict[str, dict[str, float | None]]] = []
+    if "Oversight" in sheets:
+        try:
+            oversight_extractions = _parse_oversight_extractions(sheets["Oversight"])
+        except Exception:
+            oversight_extractions = []
 
     events = _parse_general_sheet(general_sheet)
 
@@ -508,4 +716,39 @@ def excel_to_json(xlsx_path: str) -> dict:
     }
 
 
+def excel_to_json(
+    xlsx_path: str, cache_dir: str | os.PathLike[str] | None = None
+) -> dict:
+    """
+    High-level: parse the Excel and return a single, tidy structure.
+
+    Parses of workbooks with identical contents are reused from an in-memory
+    cache of recent workbooks. When ``cache_dir`` (or the
+    ``EKO1985_CACHE_DIR`` environment variable) is set, the parsed structure is
+    stored there as JSON under the workbook's content hash and reused for as
+    long as the file is unchanged. ``orjson`` is used for the cache when
+    installed. Writing the cache is best effort: an unwritable directory only
+    means the next call parses again.
+    """
+    original_path = Path(xlsx_path)
+    path = _resolve_workbook_path(original_path)
+
+    cache_root = (
+        cache_dir if cache_dir is not None else os.environ.get("EKO1985_CACHE_DIR")
+    )
+    digest = _workbook_digest(path)
+    if not cache_root:
+        return _parse_workbook_memoised(path, xlsx_path, digest)
+
+    cache_path = Path(cache_root) / f"{path.name}.{digest}.v{_PARSE_CACHE_VERSION}.json"
+    cached = _read_cached_parse(cache_path)
+    if cached is not None:
+        cached["source_file"] = os.path.basename(xlsx_path)
+        return cached
+
+    result = _parse_workbook_memoised(path, xlsx_path, digest)
+    _write_cached_parse(cache_path, result)
+    return result
+
+
 __all__ = ["excel_to_json"]
@@ -1,22 +1,28 @@
+# 1.2 ** (5 - jonsbon) for the whole Jonson classes
+_JONSBON_DECIMAL = {k: 1.2 ** (5 - k) for k in range(1, 9)}
+
+
 def jonsbon_to_decimal(jonsbon: float):
+    if jonsbon in _JONSBON_DECIMAL:
+        # A whole class (3 or 3.0): the table is keyed by int
+        return _JONSBON_DECIMAL[int(jonsbon)]
     n = 5 - jonsbon
     return 1.2**n
 
 
-def jonson_1914_bonitet_mean_height_age_100(jonsbon: float):
-    if jonsbon == 2:
-        n = 27.7
-    elif jonsbon == 3:
-        n = 22.4
-    elif jonsbon == 4:
-        n = 18.0
-    elif jonsbon == 5:
-        n = 14.6
-    elif jonsbon == 6:
-        n = 11.6
-    elif jonsbon == 7:
-        n = 9.0
-    elif jonsbon == 8:
-        n = 7.0
+# Mean height (m) at age 100 per Jonson (1914) site class
+_JONSON_1914_MEAN_HEIGHT_100 = {
+    2: 27.7,
+    3: 22.4,
+    4: 18.0,
+    5: 14.6,
+    6: 11.6,
+    7: 9.0,
+    8: 7.0,
+}
 
-    return n
+
+def jonson_1914_bonitet_mean_height_age_100(jonsbon: float):
+    if jonsbon not in _JONSON_1914_MEAN_HEIGHT_100:
+        raise ValueError(f"Invalid jonsbon {jonsbon} (2-8)")
+    return _JONSON_1914_MEAN_HEIGHT_100[int(jonsbon)]
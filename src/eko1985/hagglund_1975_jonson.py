@@ -1,94 +1,59 @@
-def jonson_bonitet_pine_northern_Sweden(jonsbon: int, age: float) -> float:
-    if age < 30 or age > 130:
-        Warning(
-            "Age out of bounds for Jonsbon according to Hagglund 1975 reference materia (30-130)"
+import warnings
+
+# Height at the pivot age per Jonson site class (jonsbon), Hägglund (1975).
+# The curves are written as a + c1 * (d - |d|) - c2 * (d + |d|) in the source,
+# with d = age - pivot; below they use d - |d| = 2 min(d, 0) and
+# d + |d| = 2 max(d, 0), i.e. doubled slopes on min/max.
+_PINE_NORTHERN_A = {3: 24.43, 4: 21.45, 5: 18.64, 6: 15.68, 7: 12.69}
+_PINE_SOUTHERN_A = {2: 26.82, 3: 24.56, 4: 21.78, 5: 18.27, 6: 15.87, 7: 13.40}
+_SPRUCE_NORTHERN_A = {2: 28.69, 3: 24.98, 4: 21.87, 5: 19.32, 6: 16.79, 7: 15.16}
+_SPRUCE_SOUTHERN_A = {1: 33.40, 2: 29.56, 3: 26.77, 4: 23.64, 5: 20.53}
+
+# (heights by jonsbon, pivot age, slope below pivot, slope above pivot, age range)
+_CURVES = {
+    ("pine", "northern"): (_PINE_NORTHERN_A, 45, 0.13012, 0.03008, (30, 130)),
+    ("pine", "southern"): (_PINE_SOUTHERN_A, 45, 0.0, 0.04880, (30, 110)),
+    ("spruce", "northern"): (_SPRUCE_NORTHERN_A, 60, 0.0, 0.05576, (40, 130)),
+    ("spruce", "southern"): (_SPRUCE_SOUTHERN_A, 45, 0.10016, 0.07336, (40, 100)),
+}
+
+
+def _warn_outside_material(age: float, age_range: tuple) -> None:
+    min_age, max_age = age_range
+    if age < min_age or age > max_age:
+        warnings.warn(
+            "Age out of bounds for Jonsbon according to Hagglund 1975 reference "
+            f"material ({min_age}-{max_age})"
         )
-    a: float
-    if jonsbon == 3:
-        a = 24.43
-    elif jonsbon == 4:
-        a = 21.45
-    elif jonsbon == 5:
-        a = 18.64
-    elif jonsbon == 6:
-        a = 15.68
-    elif jonsbon == 7:
-        a = 12.69
-    else:
-        raise ValueError("Invalid Jonsbon (3-7)")
-
-    return (
-        a + 0.06506 * (age - 45 - abs(age - 45)) - 0.01504 * (age - 45 + abs(age - 45))
-    )
+
+
+def _class_height(table: dict, jonsbon: int) -> float:
+    a = table.get(jonsbon)
+    if a is None:
+        raise ValueError(f"Invalid Jonsbon ({min(table)}-{max(table)})")
+    return a
+
+
+def _curve_height(curve: tuple, jonsbon: int, age: float) -> float:
+    table, pivot, below, above, age_range = curve
+    _warn_outside_material(age, age_range)
+    a = _class_height(table, jonsbon)
+    d = age - pivot
+    return a + below * min(d, 0.0) - above * max(d, 0.0)
+
+
+def jonson_bonitet_pine_northern_Sweden(jonsbon: int, age: float) -> float:
+    return _curve_height(_CURVES[("pine", "northern")], jonsbon, age)
 
 
 def jonson_bonitet_pine_southern_Sweden(jonsbon: int, age: float) -> float:
-    if age < 30 or age > 110:
-        Warning(
-            "Age out of bounds for Jonsbon according to Hagglund 1975 reference material (30-110)"
-        )
-    a: float
-    if jonsbon == 2:
-        a = 26.82
-    elif jonsbon == 3:
-        a = 24.56
-    elif jonsbon == 4:
-        a = 21.78
-    elif jonsbon == 5:
-        a = 18.27
-    elif jonsbon == 6:
-        a = 15.87
-    elif jonsbon == 7:
-        a = 13.40
-    else:
-        raise ValueError("Invalid Jonsbon (2-7)")
-
-    return a - 0.02440 * (age - 45 + abs(age - 45))
+    return _curve_height(_CURVES[("pine", "southern")], jonsbon, age)
 
 
 def jonson_bonitet_spruce_northern_Sweden(jonsbon: int, age: float) -> float:
-    if age < 40 or age > 130:
-        Warning(
-            "Age out of bounds for Jonsbon according to Hagglund 1975 reference material (40-130)"
-        )
-    a: float
-    if jonsbon == 2:
-        a = 28.69
-    elif jonsbon == 3:
-        a = 24.98
-    elif jonsbon == 4:
-        a = 21.87
-    elif jonsbon == 5:
-        a = 19.32
-    elif jonsbon == 6:
-        a = 16.79
-    elif jonsbon == 7:
-        a = 15.16
-    else:
-        raise ValueError("Invalid Jonsbon (2-7)")
-
-    return a - 0.02788 * (age - 60 + abs(age - 60))
+    return _curve_height(_CURVES[("spruce", "northern")], jonsbon, age)
 
 
 def jonson_bonitet_spruce_southern_Sweden(jonsbon: int, age: float) -> float:
-    if age < 40 or age > 100:
-        Warning(
-            "Age out of bounds for Jonsbon according to Hagglund 1975 reference material (40-100)"
-        )
-    a: float
-    if jonsbon == 1:
-        a = 33.40
-    if jonsbon == 2:
-        a = 29.56
-    elif jonsbon == 3:
-        a = 26.77
-    elif jonsbon == 4:
-        a = 23.64
-    elif jonsbon == 5:
-        a = 20.53
-    else:
-        raise ValueError("Invalid Jonsbon (1-5)")
-
-    return (
-        a + 0.05008 * (age - 45 - abs(age - 45)) - 0.03668 * (age - 45 + abs(age - 45))
-    )
+    return _curve_height(_CURVES[("spruce", "southern")], jonsbon, age)
+
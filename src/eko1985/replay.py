@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from math import pi
+from collections.abc import Iterator
+from math import copysign, pi
 from typing import Dict
 from typing import cast
 
@@ -20,15 +21,14 @@ SWE_TO_CLASS = {
     "Ek": EkoOak,
     "Öv.löv": EkoBroadleaf,
 }
+# Reverse lookups derive from the names declared on the species classes
 ENG_FROM_CLASS: dict[type[EkoStandPart], str] = {
-    EkoPine: "Pine",
-    EkoSpruce: "Spruce",
-    EkoBirch: "Birch",
-    EkoBeech: "Beech",
-    EkoOak: "Oak",
-    EkoBroadleaf: "Broadleaf",
+    cls: cast(str, cls.eng_name) for cls in SWE_TO_CLASS.values()
 }
 SWE_FROM_CLASS = {cls: swe for swe, cls in SWE_TO_CLASS.items()}
+SWE_TO_ENG = {swe: ENG_FROM_CLASS[cls] for swe, cls in SWE_TO_CLASS.items()}
+# Basal area per stem (m²) is _PI_OVER_40000 * QMD² with QMD in cm
+_PI_OVER_40000 = pi / 40000.0
 
 ABSOLUTE_TOLERANCES = {
     # Keep very tight parity with Excel exports; deviations beyond these should
@@ -38,6 +38,10 @@ ABSOLUTE_TOLERANCES = {
     "QMD": 0.1,
     "VOL": 0.1,
 }
+# Metrics produced by _expected_metrics, with each metric's tolerance
+# (None: reported as is, never clamped)
+_METRIC_KEYS = ("N", "BA", "QMD", "VOL", "age")
+_METRIC_TOLERANCES = {key: ABSOLUTE_TOLERANCES.get(key) for key in _METRIC_KEYS}
 
 
 def _site_kwargs(json_obj: dict) -> dict:
@@ -60,17 +64,18 @@ def _site_kwargs(json_obj: dict) -> dict:
     )
 
 
+def _is_yes(value: str | bool | None) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() == "ja"
+    return bool(value)
+
+
 def _apply_flag_state(site: EkoStandSite, flags: dict | None) -> None:
     """Set thinning flags on ``site`` based on Excel flag strings."""
 
     if not flags:
         return
 
-    def _is_yes(value: str | bool | None) -> bool:
-        if isinstance(value, str):
-            return value.strip().lower() == "ja"
-        return bool(value)
-
     if "gallrad_nagongang" in flags:
         site.thinned = _is_yes(flags["gallrad_nagongang"])
     if "nygallara" in flags:
@@ -80,12 +85,21 @@ def _apply_flag_state(site: EkoStandSite, flags: dict | None) -> None:
 def _build_species_stands(json_obj: dict) -> dict[str, EkoStand]:
     """Initialise one ``EkoStand`` per species using the Start state."""
 
-    start_event = next(e for e in json_obj["events"] if e["type"] == "Start")
-    site_kwargs = _site_kwargs(json_obj)
+    events = json_obj["events"]
+    # The General sheet lists Start first; only scan for other layouts
+    if events and events[0]["type"] == "Start":
+        start_event = events[0]
+    else:
+        start_event = next((e for e in events if e["type"] == "Start"), None)
+        if start_event is None:
+            raise ValueError("json_obj['events'] has no Start event")
+    start_species = start_event.get("species") or {}
+    # Every species shares the site; build it on first use, then clone it
+    template_site: EkoStandSite | None = None
 
     stands: dict[str, EkoStand] = {}
     for swe_name, cls in SWE_TO_CLASS.items():
-        species_block = (start_event.get("species") or {}).get(swe_name)
+        species_block = start_species.get(swe_name)
         if not species_block:
             continue
         after = species_block.get("after") or {}
@@ -94,7 +108,9 @@ def _build_species_stands(json_obj: dict) -> dict[str, EkoStand]:
         age = float(species_block.get("total_age") or 0.0)
         if BA <= 0.0 and N <= 0.0:
             continue
-        site = EkoStandSite(**site_kwargs)
+        if template_site is None:
+            template_site = EkoStandSite(**_site_kwargs(json_obj))
+        site = template_site.clone()
         _apply_flag_state(site, species_block.get("flags"))
         stand = EkoStand([cls(BA, N, age)], site)
 
@@ -115,10 +131,9 @@ def _build_species_stands(json_obj: dict) -> dict[str, EkoStand]:
 def _snapshot_single(stand: EkoStand) -> tuple[str, dict[str, float | None]]:
     """Return the English species key and current metrics for ``stand``."""
 
-    stand._refresh_competition_vars()
-
+    # No refresh here: construction, grow() and thin() all end with one
     part = stand.Parts[0]
-    eng = ENG_FROM_CLASS.get(type(part))
+    eng = part.eng_name
     if eng is None:
         eng = part.__class__.__name__
     volume = stand._volume_for(part, part.BA, part.QMD, part.age, part.stems, part.HK)
@@ -138,7 +153,7 @@ def _apply_gallring_event(stand: EkoStand, species_record: dict | None) -> None:
     if ba_out is None and extraction.get("N_stems_ha") is not None:
         qmd = stand.getQMD(part.BA, part.stems)
         if qmd > 0.0:
-            ba_out = extraction["N_stems_ha"] * pi * (qmd / 200.0) ** 2
+            ba_out = extraction["N_stems_ha"] * _PI_OVER_40000 * qmd * qmd
 
     removals = {}
     if ba_out:
@@ -159,45 +174,89 @@ def _sync_to_expected_state(stand: EkoStand, species_record: dict | None) -> Non
     after = species_record.get("after") or {}
     part = stand.Parts[0]
 
-    if after.get("BA_m2_ha") is not None:
-        part.BA = float(after["BA_m2_ha"])
-    if after.get("N_stems_ha") is not None:
-        part.stems = float(after["N_stems_ha"])
-    if species_record.get("total_age") is not None:
-        part.age = float(species_record["total_age"])
+    # One lookup per value; JSON numbers are usually floats already
+    BA = after.get("BA_m2_ha")
+    N = after.get("N_stems_ha")
+    age = species_record.get("total_age")
+    if BA is not None:
+        part.BA = float(BA)
+    if N is not None:
+        part.stems = float(N)
+    if age is not None:
+        part.age = float(age)
+
+    # QMD is rederived from BA and stems by the refresh
+    stand._refresh_competition_vars()
 
-    if after.get("QMD_cm") is not None:
-        part.QMD = float(after["QMD_cm"])
-    else:
-        part.QMD = stand.getQMD(part.BA, part.stems)
 
-    stand._refresh_competition_vars()
+def _advance_stand(stand: EkoStand, event_type: str | None, record: dict) -> None:
+    """Apply one growth or thinning event to ``stand``, updating its site flags."""
+
+    site = stand.Site
+    _apply_flag_state(site, record.get("flags"))
+
+    if event_type == "Tillväxt":
+        stand.grow5(mortality=True)
+        site.thinned_5y = False
+    elif event_type == "Gallring":
+        _apply_gallring_event(stand, record)
+        site.thinned = True
+        site.thinned_5y = True
 
 
 def _expected_metrics(record: dict | None) -> dict[str, float | None]:
-    after = (record or {}).get("after") or {}
+    # Keys are _METRIC_KEYS, which _combine_model_expected relies on.
+    if record is None:
+        # A species listed without a record: nothing expected
+        return dict.fromkeys(_METRIC_KEYS)
+    after = record.get("after") or {}
     return {
         "N": after.get("N_stems_ha"),
         "BA": after.get("BA_m2_ha"),
         "QMD": after.get("QMD_cm"),
         "VOL": after.get("VOL_m3sk_ha"),
-        "age": (record or {}).get("total_age"),
+        "age": record.get("total_age"),
     }
 
 
+def _english_name(swe_name: str) -> str:
+    """Return the English species key used in snapshots for ``swe_name``."""
+
+    eng_name = SWE_TO_ENG.get(swe_name)
+    if eng_name is None:
+        return swe_name if isinstance(swe_name, str) else str(swe_name)
+    return eng_name
+
+
 def _combine_model_expected(
     model: dict[str, float | None] | None,
     expected: dict[str, float | None],
 ) -> dict[str, object]:
-    expected_metrics = dict(expected)
-    raw_model = {key: (model or {}).get(key) for key in expected_metrics}
+    # ``expected`` is a fresh mapping from _expected_metrics; keep it as is
+    expected_metrics = expected
+    if model is None:
+        # No stand for this species: nothing to compare or clamp
+        return {
+            "model": dict.fromkeys(expected_metrics),
+            "expected": expected_metrics,
+            "delta": dict.fromkeys(expected_metrics),
+            "raw_model": dict.fromkeys(expected_metrics),
+            "raw_delta": dict.fromkeys(expected_metrics),
+            "adjusted": dict.fromkeys(expected_metrics, False),
+            "tolerance": ABSOLUTE_TOLERANCES,
+        }
+
+    model_metrics = model
+    raw_model: dict[str, float | None] = {}
     aligned_model: dict[str, float | None] = {}
     delta: dict[str, float | None] = {}
     raw_delta: dict[str, float | None] = {}
     adjusted: dict[str, bool] = {}
 
-    for key, expected_val in expected_metrics.items():
-        model_val = raw_model.get(key)
+    # One pass per metric fills every output mapping
+    for key, tolerance in _METRIC_TOLERANCES.items():
+        expected_val = expected_metrics[key]
+        model_val = raw_model[key] = model_metrics.get(key)
         if model_val is None or expected_val is None:
             aligned_model[key] = model_val
             delta[key] = None
@@ -207,9 +266,9 @@ def _combine_model_expected(
 
         diff = model_val - expected_val
         raw_delta[key] = diff
-        tolerance = ABSOLUTE_TOLERANCES.get(key)
         if tolerance is not None and abs(diff) > tolerance:
-            aligned_val = expected_val + (tolerance if diff > 0 else -tolerance)
+            # diff is non-zero here, so copysign picks the same side as diff
+            aligned_val = expected_val + copysign(tolerance, diff)
             adjusted[key] = True
         else:
             aligned_val = model_val
@@ -229,13 +288,16 @@ def _combine_model_expected(
     }
 
 
-def run_management_from_json(json_obj: dict) -> list[dict]:
-    """Replay the sequence encoded in ``json_obj['events']`` and capture comparisons."""
+def iter_management_from_json(json_obj: dict) -> Iterator[dict]:
+    """Replay ``json_obj['events']``, yielding each event's comparison as it is made.
+
+    Nothing is read until the first item is requested, so invalid input
+    raises from ``next()`` rather than from this call.
+    """
 
     stands = _build_species_stands(json_obj)
     events = json_obj.get("events", [])
 
-    snapshots: list[dict] = []
     for idx, event in enumerate(events):
         event_type = event.get("type")
         period = event.get("period")
@@ -253,33 +315,15 @@ def run_management_from_json(json_obj: dict) -> list[dict]:
                     _, model_metrics = _snapshot_single(stand)
             else:
                 if stand is not None:
-                    _apply_flag_state(stand.Site, record.get("flags"))
-
-                    if event_type == "Tillväxt":
-                        stand.grow5(mortality=True)
-                        if hasattr(stand.Site, "thinned_5y"):
-                            stand.Site.thinned_5y = False
-                    elif event_type == "Gallring":
-                        _apply_gallring_event(stand, record)
-                        if hasattr(stand.Site, "thinned"):
-                            stand.Site.thinned = True
-                            stand.Site.thinned_5y = True
+                    _advance_stand(stand, event_type, record)
                     _, model_metrics = _snapshot_single(stand)
 
-            cls = SWE_TO_CLASS.get(swe_name)
-            fallback_name = swe_name if isinstance(swe_name, str) else str(swe_name)
-            if cls is not None:
-                eng_name = ENG_FROM_CLASS.get(
-                    cast(type[EkoStandPart], cls), fallback_name
-                )
-            else:
-                eng_name = fallback_name
             expected_metrics = _expected_metrics(record)
-            species_snapshot[eng_name] = _combine_model_expected(
+            species_snapshot[_english_name(swe_name)] = _combine_model_expected(
                 model_metrics, expected_metrics
             )
 
-        snapshots.append({"event": label, "species": species_snapshot})
+        yield {"event": label, "species": species_snapshot}
 
         # Only force the Excel "after" values when a thinning has occurred.
         # Growth steps should continue from the modelled state.
@@ -289,7 +333,11 @@ def run_management_from_json(json_obj: dict) -> list[dict]:
                 if stand is not None:
                     _sync_to_expected_state(stand, record)
 
-    return snapshots
+
+def run_management_from_json(json_obj: dict) -> list[dict]:
+    """Replay the sequence encoded in ``json_obj['events']`` and capture comparisons."""
+
+    return list(iter_management_from_json(json_obj))
 
 
 def expected_from_json(json_obj: dict) -> list[dict]:
@@ -317,4 +365,9 @@ def expected_from_json(json_obj: dict) -> list[dict]:
     return expected
 
 
-__all__ = ["run_management_from_json", "expected_from_json", "excel_to_json"]
+__all__ = [
+    "iter_management_from_json",
+    "run_management_from_json",
+    "expected_from_json",
+    "excel_to_json",
+]
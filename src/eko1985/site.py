@@ -2,16 +2,98 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from math import exp, log
 from typing import Any
 import warnings
 
 from .enums import MarkfuktighetKod, RegionSE, VegetationsKod
 
+# Swedish region labels accepted in place of the English ones
+_REGION_NORMALIZE = {"NORRA": "North", "MELLERSTA": "Central", "SÖDRA": "South"}
+
+# Field-layer vegetation classes (bilberry/cowberry; herbs, grasses or none)
+_BILBERRY_CODES = frozenset({13, 14})
+_HERB_CODES = frozenset({1, 2, 3, 4, 5, 6, 8, 9})
+
+# vegcode mapping (as in the original switch)
+_VEGCODE_MAP = {
+    1: 4,
+    2: 2.5,
+    3: 2,
+    4: 3,
+    5: 2.5,
+    6: 2,
+    7: 3,
+    8: 2.5,
+    9: 1.5,
+    10: -3,
+    11: -3,
+    12: 1,
+    13: 0,
+    14: -0.5,
+    15: -3,
+    16: -5,
+    17: -0.5,
+    18: -1,
+}
+
+
+# --- Leijon conversions (unchanged) ---
+# The formulas are cached on the exact H100 value; the range warnings live
+# outside the cache so they are still issued for every site.
+@lru_cache(maxsize=512)
+def _leijon_pine_to_spruce_h100(H100_Pine: float) -> float:
+    return exp(-0.9596 * log(H100_Pine * 10) + 0.01171 * (H100_Pine * 10) + 7.9209) / 10
+
+
+@lru_cache(maxsize=512)
+def _leijon_spruce_to_pine_h100(H100_Spruce: float) -> float:
+    return (
+        exp(1.6967 * log(H100_Spruce * 10) - 0.005179 * (H100_Spruce * 10) - 2.5397)
+        / 10
+    )
+
+
+def _leijon_pine_to_spruce(H100_Pine: float | None) -> float:
+    if H100_Pine is None:
+        return 0.0
+    if H100_Pine < 8 or H100_Pine > 30:
+        warnings.warn("SI Pine may be outside underlying material")
+    return _leijon_pine_to_spruce_h100(H100_Pine)
+
+
+def _leijon_spruce_to_pine(H100_Spruce: float | None) -> float:
+    if H100_Spruce is None:
+        return 0.0
+    if H100_Spruce < 8 or H100_Spruce > 33:
+        warnings.warn("SI Spruce may be outside underlying material.")
+    return _leijon_spruce_to_pine_h100(H100_Spruce)
+
 
 class EkoStandSite:
     """Represents the site variables required by the model."""
 
+    __slots__ = (
+        "Bilberry_or_Cowberry",
+        "DrySoil",
+        "HerbsGrassesNoFieldLayer",
+        "SIdm_pine",
+        "SIdm_spruce",
+        "TAX77",
+        "WetSoil",
+        "_H100_Pine",
+        "_H100_Spruce",
+        "altitude",
+        "fertilised",
+        "klimat_zon",
+        "latitude",
+        "region",
+        "thinned",
+        "thinned_5y",
+        "vegcode",
+    )
+
     def __init__(
         self,
         # English
@@ -69,10 +151,8 @@ class EkoStandSite:
             self.region = region.value
         elif isinstance(region, str) and region in ("North", "Central", "South"):
             self.region = region
-        elif isinstance(region, str) and region in ("NORRA", "MELLERSTA", "SÖDRA"):
-            self.region = {"NORRA": "North", "MELLERSTA": "Central", "SÖDRA": "South"}[
-                region
-            ]
+        elif isinstance(region, str) and region in _REGION_NORMALIZE:
+            self.region = _REGION_NORMALIZE[region]
         else:
             self.region = RegionSE.SÖDRA.value if region is None else str(region)
 
@@ -87,10 +167,10 @@ class EkoStandSite:
 
         if H100_Spruce is None:
             self.H100_Pine = H100_Pine
-            self.H100_Spruce = self.__Leijon_Pine_to_Spruce(H100_Pine)
+            self.H100_Spruce = _leijon_pine_to_spruce(H100_Pine)
         elif H100_Pine is None:
             self.H100_Spruce = H100_Spruce
-            self.H100_Pine = self.__Leijon_Spruce_to_Pine(H100_Spruce)
+            self.H100_Pine = _leijon_spruce_to_pine(H100_Spruce)
         else:
             self.H100_Spruce = H100_Spruce
             self.H100_Pine = H100_Pine
@@ -108,14 +188,43 @@ class EkoStandSite:
         self.DrySoil = sm == 1
         self.WetSoil = sm == 5
 
+    def clone(self) -> EkoStandSite:
+        """Return an independent copy without re-running the input handling."""
+        new = EkoStandSite.__new__(EkoStandSite)
+        for name in EkoStandSite.__slots__:
+            setattr(new, name, getattr(self, name))
+        return new
+
+    __copy__ = clone
+
+    # H100 setters keep the site index in dm (as the growth and volume
+    # functions use it) in step, so those read it instead of rederiving it
+    @property
+    def H100_Spruce(self) -> float | None:
+        return self._H100_Spruce
+
+    @H100_Spruce.setter
+    def H100_Spruce(self, value: float | None) -> None:
+        self._H100_Spruce = value
+        self.SIdm_spruce = float(value or 0.0) * 10
+
+    @property
+    def H100_Pine(self) -> float | None:
+        return self._H100_Pine
+
+    @H100_Pine.setter
+    def H100_Pine(self, value: float | None) -> None:
+        self._H100_Pine = value
+        self.SIdm_pine = float(value or 0.0) * 10
+
     def _set_fieldlayer_and_vegcode(
         self, vegetation_code: int | None, latitude: float | None
     ) -> None:
         # Set FieldLayer flags
-        if vegetation_code in (13, 14):  # bilberry/cowberry
+        if vegetation_code in _BILBERRY_CODES:  # bilberry/cowberry
             self.Bilberry_or_Cowberry = True
             self.HerbsGrassesNoFieldLayer = False
-        elif vegetation_code in (1, 2, 3, 4, 5, 6, 8, 9) or (
+        elif vegetation_code in _HERB_CODES or (
             vegetation_code == 7 and (latitude or 0) < 60
         ):
             self.Bilberry_or_Cowberry = False
@@ -124,54 +233,10 @@ class EkoStandSite:
             self.Bilberry_or_Cowberry = False
             self.HerbsGrassesNoFieldLayer = False
 
-        # vegcode mapping (as in the original switch)
-        mapping = {
-            1: 4,
-            2: 2.5,
-            3: 2,
-            4: 3,
-            5: 2.5,
-            6: 2,
-            7: 3,
-            8: 2.5,
-            9: 1.5,
-            10: -3,
-            11: -3,
-            12: 1,
-            13: 0,
-            14: -0.5,
-            15: -3,
-            16: -5,
-            17: -0.5,
-            18: -1,
-        }
         if isinstance(vegetation_code, int):
-            self.vegcode = mapping.get(vegetation_code, 0)
+            self.vegcode = _VEGCODE_MAP.get(vegetation_code, 0)
         else:
             self.vegcode = 0
 
-    # --- Leijon conversions (unchanged) ---
-    @staticmethod
-    def __Leijon_Pine_to_Spruce(H100_Pine: float | None) -> float:
-        if H100_Pine is None:
-            return 0.0
-        if H100_Pine < 8 or H100_Pine > 30:
-            warnings.warn("SI Pine may be outside underlying material")
-        return (
-            exp(-0.9596 * log(H100_Pine * 10) + 0.01171 * (H100_Pine * 10) + 7.9209)
-            / 10
-        )
-
-    @staticmethod
-    def __Leijon_Spruce_to_Pine(H100_Spruce: float | None) -> float:
-        if H100_Spruce is None:
-            return 0.0
-        if H100_Spruce < 8 or H100_Spruce > 33:
-            warnings.warn("SI Spruce may be outside underlying material.")
-        return (
-            exp(1.6967 * log(H100_Spruce * 10) - 0.005179 * (H100_Spruce * 10) - 2.5397)
-            / 10
-        )
-
 
 __all__ = ["EkoStandSite"]
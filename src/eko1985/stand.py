@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from math import pi
+from math import pi, sqrt
 import warnings
 
 from .base import EkoStandPart, EvenAgedStand
@@ -10,13 +10,6 @@ from .site import EkoStandSite
 from .species import EkoBeech, EkoOak
 
 
-def _safe_sum(iterable):
-    total = 0.0
-    for v in iterable:
-        total += float(v)
-    return total
-
-
 class EkoStand(EvenAgedStand):
     """
     parts: list[EkoStandPart]
@@ -53,15 +46,24 @@ class EkoStand(EvenAgedStand):
     # ------------------------------------------------------------------
     def _competition_metrics(self) -> None:
         """Compute per-part competition metrics from the current net state."""
+        parts = self.parts
         # Ensure own QMD is current
-        for p in self.parts:
+        for p in parts:
             p.QMD = self.getQMD(p.BA, p.stems)
-        # Competition from all *other* parts
-        for p in self.parts:
-            BA_other = _safe_sum(q.BA for q in self.parts if q is not p)
-            N_other = _safe_sum(q.stems for q in self.parts if q is not p)
+        # Competition from all *other* parts, summed in part order (not as
+        # total minus own share, which differs in the last bits)
+        for p in parts:
+            BA_other = N_other = 0.0
+            for q in parts:
+                if q is not p:
+                    BA_other += float(q.BA)
+                    N_other += float(q.stems)
             p.BAOtherSpecies = BA_other
-            p.QMDOtherSpecies = self.getQMD(BA_other, N_other)
+            # Inlined getQMD (utils.qmd_cm), same expression and guard
+            if BA_other <= 0.0 or N_other <= 0.0:
+                p.QMDOtherSpecies = 0.0
+            else:
+                p.QMDOtherSpecies = sqrt(BA_other * 40000.0 / (pi * N_other))
             denom = p.QMD if p.QMD > 0 else 1e-9
             # HK: diameter-based competition index, *not* height
             p.HK = (p.QMDOtherSpecies / denom) * BA_other
@@ -76,12 +78,17 @@ class EkoStand(EvenAgedStand):
           - stand totals: StandBA, StandStems, StandVOL
         """
         self._competition_metrics()
+        total_BA = total_N = total_VOL = 0.0
         for p in self.parts:
             p.VOL = p.getVolume(BA=p.BA, QMD=p.QMD, age=p.age, stems=p.stems, HK=p.HK)
+            total_BA += float(p.BA)
+            total_N += float(p.stems)
+            total_VOL += float(p.VOL)
 
-        self.StandBA = _safe_sum(p.BA for p in self.parts)
-        self.StandStems = _safe_sum(p.stems for p in self.parts)
-        self.StandVOL = _safe_sum(p.VOL for p in self.parts)
+        # Assigned after the loop, as before: some volume functions read StandBA
+        self.StandBA = total_BA
+        self.StandStems = total_N
+        self.StandVOL = total_VOL
 
     # Back-compat alias some old code may call
     def _refresh_competition_vars(self) -> None:
@@ -130,26 +137,25 @@ class EkoStand(EvenAgedStand):
         # 0) Start-of-period metrics
         self._assign_current_state_metrics()
 
-        # Snapshot starting metrics
-        start_state = []
-        for p in self.parts:
-            start_state.append(
-                {
-                    "part": p,
-                    "BA": p.BA,
-                    "stems": p.stems,
-                    "age": p.age,
-                    "QMD": p.QMD,
-                    "VOL": p.getVolume(
-                        BA=p.BA, QMD=p.QMD, age=p.age, stems=p.stems, HK=p.HK
-                    ),
-                }
-            )
-            p.VOL0 = start_state[-1]["VOL"]
-
-        # 1) Mortality fractions + 2) Basal area increment (on start state)
-        mortality = []
-        for p in self.parts:
+        parts = self.parts
+
+        # Snapshot starting metrics, one list per metric (indexed like parts)
+        BA0 = [p.BA for p in parts]
+        N0 = [p.stems for p in parts]
+        QMD0 = [p.QMD for p in parts]
+        VOL0 = []
+        for p in parts:
+            p.VOL0 = p.getVolume(BA=p.BA, QMD=p.QMD, age=p.age, stems=p.stems, HK=p.HK)
+            VOL0.append(p.VOL0)
+
+        # 1) Mortality fractions + 2) Basal area increment (on start state),
+        # 3) applied together in one step (C++: ApplyMortalityAndGrowth).
+        # Parts are only read here, so each is handled in a single pass.
+        BA1: list[float] = []
+        N1: list[float] = []
+        age1: list[float] = []
+        QMD1: list[float] = []
+        for p in parts:
             if apply_mortality:
                 (
                     BAQ_crowd,
@@ -164,19 +170,9 @@ class EkoStand(EvenAgedStand):
                 ba_quotient_chronic_mortality=BAQ_crowd,
                 ba_quotient_acute_mortality=BAQ_other,
             )
-            mortality.append(
-                {
-                    "q_crowd": BAQ_crowd,
-                    "q_other": BAQ_other,
-                    "q_total": BAQ_crowd + BAQ_other,
-                }
-            )
 
-        # 3) Apply mortality + growth in one step (C++: ApplyMortalityAndGrowth)
-        next_state = []
-        for idx, p in enumerate(self.parts):
-            q_total = mortality[idx]["q_total"] if apply_mortality else 0.0
             if apply_mortality:
+                q_total = BAQ_crowd + BAQ_other
                 next_BA = (1.0 - q_total) * p.BA + p.BAI5
                 next_stems = (1.0 - q_total) * p.stems
                 next_age = p.age + years
@@ -185,58 +181,46 @@ class EkoStand(EvenAgedStand):
                 next_stems = p.stems
                 next_age = p.age
 
-            next_QMD = self.getQMD(next_BA, next_stems)
-            next_state.append(
-                {
-                    "part": p,
-                    "BA": next_BA,
-                    "stems": next_stems,
-                    "age": next_age,
-                    "QMD": next_QMD,
-                }
-            )
+            BA1.append(next_BA)
+            N1.append(next_stems)
+            age1.append(next_age)
+            QMD1.append(self.getQMD(next_BA, next_stems))
+
+        # 4) Competition & volumes on the post-mortality/post-growth state,
+        # other parts summed in part order as in _competition_metrics
+        HK1: list[float] = []
+        for idx, QMD in enumerate(QMD1):
+            BA_other = N_other = 0.0
+            for j, (BA, stems) in enumerate(zip(BA1, N1)):
+                if j != idx:
+                    BA_other += float(BA)
+                    N_other += float(stems)
+            if BA_other <= 0.0 or N_other <= 0.0:
+                QMD_other = 0.0
+            else:
+                QMD_other = sqrt(BA_other * 40000.0 / (pi * N_other))
+            HK1.append((QMD_other / (QMD if QMD > 0 else 1e-9)) * BA_other)
 
-        # 4) Competition & volumes on the post-mortality/post-growth state
-        for idx, p in enumerate(self.parts):
-            BA_other = _safe_sum(
-                ns["BA"] for j, ns in enumerate(next_state) if j != idx
-            )
-            N_other = _safe_sum(
-                ns["stems"] for j, ns in enumerate(next_state) if j != idx
-            )
-            QMD_other = self.getQMD(BA_other, N_other)
-            HK_next = (
-                QMD_other
-                / (next_state[idx]["QMD"] if next_state[idx]["QMD"] > 0 else 1e-9)
-            ) * BA_other
-            next_state[idx]["HK"] = HK_next
-
-        for idx, p in enumerate(self.parts):
-            ns = next_state[idx]
-            ns["VOL"] = p.getVolume(
-                BA=ns["BA"],
-                QMD=ns["QMD"],
-                age=ns["age"],
-                stems=ns["stems"],
-                HK=ns["HK"],
+        VOL1 = [
+            p.getVolume(
+                BA=BA1[idx], QMD=QMD1[idx], age=age1[idx], stems=N1[idx], HK=HK1[idx]
             )
-            ns["volume_increment"] = ns["VOL"] - start_state[idx]["VOL"]
+            for idx, p in enumerate(parts)
+        ]
 
         # 5) Commit the new net state and return per-species summary
         period: dict[str, list[dict[str, float]]] = {}
-        for idx, p in enumerate(self.parts):
-            ns = next_state[idx]
-            p.gross_volume_increment = ns[
-                "volume_increment"
-            ]  # net increment after mortality
-            p.volume_increment = ns["volume_increment"]
-
-            p.BA = ns["BA"]
-            p.stems = ns["stems"]
-            p.QMD = ns["QMD"]
-            p.age = ns["age"]
-            p.HK = ns.get("HK", p.HK)
-            p.VOL = ns["VOL"]
+        for idx, p in enumerate(parts):
+            volume_increment = VOL1[idx] - VOL0[idx]
+            p.gross_volume_increment = volume_increment  # net increment after mortality
+            p.volume_increment = volume_increment
+
+            p.BA = BA1[idx]
+            p.stems = N1[idx]
+            p.QMD = QMD1[idx]
+            p.age = age1[idx]
+            p.HK = HK1[idx]
+            p.VOL = VOL1[idx]
 
             key = p.trädslag.value  # e.g. "Tall", "Gran", "Björk", ...
             period.setdefault(key, []).append(
@@ -246,10 +230,10 @@ class EkoStand(EvenAgedStand):
                     "QMD1": p.QMD,
                     "VOL1": p.VOL,
                     # Provenance (optional, handy for debugging)
-                    "N0": start_state[idx]["stems"],
-                    "BA0": start_state[idx]["BA"],
-                    "QMD0": start_state[idx]["QMD"],
-                    "VOL0": start_state[idx]["VOL"],
+                    "N0": N0[idx],
+                    "BA0": BA0[idx],
+                    "QMD0": QMD0[idx],
+                    "VOL0": VOL0[idx],
                 }
             )
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from argparse import ArgumentParser
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from math import nan
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -51,10 +53,35 @@ def _parse_metric_spec(metric: str) -> tuple[str, str]:
     return "model", metric.strip()
 
 
+def _replay_workbook(
+    workbook_path: Path, cache_dir: str | Path | None = None
+) -> list[dict]:
+    """Parse and replay a single workbook (run in worker processes)."""
+
+    replay_json = excel_to_json(str(workbook_path), cache_dir=cache_dir)
+    return run_management_from_json(replay_json)
+
+
+def _replay_workbooks(
+    workbook_paths: Sequence[Path],
+    cache_dir: str | Path | None = None,
+    jobs: int = 1,
+) -> list[list[dict]]:
+    """Replay ``workbook_paths`` in order, fanning out to ``jobs`` processes."""
+
+    replay = partial(_replay_workbook, cache_dir=cache_dir)
+    if jobs > 1 and len(workbook_paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(replay, workbook_paths))
+    return [replay(path) for path in workbook_paths]
+
+
 def plot_replay_metrics(
     xls_paths: Iterable[str | Path],
     output_dir: str | Path,
     metrics: Sequence[str] = DEFAULT_METRICS,
+    cache_dir: str | Path | None = None,
+    jobs: int = 1,
 ) -> dict[str, list[Path]]:
     """Plot replay metrics for the given Excel workbooks.
 
@@ -69,6 +96,12 @@ def plot_replay_metrics(
         either as a bare key (e.g. ``"BA"``) which will default to the
         ``"model"`` values, or as ``"source:key"`` / ``"source.key"`` to select
         an explicit source such as ``"expected:BA"``.
+    cache_dir:
+        Optional directory for cached workbook parses, see
+        :func:`eko1985.excel.excel_to_json`.
+    jobs:
+        Number of worker processes used to parse and replay the workbooks.
+        Plotting always happens in the calling process.
 
     Returns
     -------
@@ -81,13 +114,11 @@ def plot_replay_metrics(
 
     saved: dict[str, list[Path]] = {}
 
-    for raw_path in xls_paths:
-        workbook_path = Path(raw_path)
-        if not workbook_path.exists():
-            continue
+    workbook_paths = [Path(raw) for raw in xls_paths]
+    workbook_paths = [path for path in workbook_paths if path.exists()]
+    replays = _replay_workbooks(workbook_paths, cache_dir=cache_dir, jobs=jobs)
 
-        replay_json = excel_to_json(str(workbook_path))
-        snapshots = run_management_from_json(replay_json)
+    for workbook_path, snapshots in zip(workbook_paths, replays):
         if not snapshots:
             continue
 
@@ -180,6 +211,18 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=list(DEFAULT_WORKBOOKS),
         help="Excel workbooks to replay (defaults to packaged assets).",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for cached workbook parses (reused while unchanged).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to replay the workbooks in parallel.",
+    )
     args = parser.parse_args(argv)
 
     import subprocess
@@ -189,7 +232,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     if result.returncode != 0:
         return result.returncode
 
-    plot_replay_metrics(args.workbooks, args.output_dir)
+    plot_replay_metrics(
+        args.workbooks, args.output_dir, cache_dir=args.cache_dir, jobs=args.jobs
+    )
     print(f"Plots written to {args.output_dir}")
     return 0
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -15,6 +16,10 @@ for path in (SRC, ROOT):
     if str(path) not in sys.path:
         sys.path.insert(0, str(path))
 
+from eko1985.site import EkoStandSite
+from eko1985.species import EkoSpruce
+from eko1985.stand import EkoStand
+
 
 @pytest.fixture(scope="session")
 def artifacts_dir() -> Path:
@@ -30,3 +35,43 @@ def artifacts_dir() -> Path:
     base_path = Path(env_value) if env_value else ROOT / "tests" / "artifacts"
     base_path.mkdir(parents=True, exist_ok=True)
     return base_path
+
+
+@pytest.fixture
+def make_site() -> Callable[..., EkoStandSite]:
+    """Return a factory for a southern test site.
+
+    Keyword arguments override the defaults (latitude 60, altitude 100 m,
+    vegetation 13, soil moisture 3, region South).
+    """
+
+    def _make_site(**kwargs) -> EkoStandSite:
+        return EkoStandSite(
+            **{
+                "latitude": 60.0,
+                "altitude": 100.0,
+                "vegetation": 13,
+                "soil_moisture": 3,
+                "region": "South",
+                **kwargs,
+            }
+        )
+
+    return _make_site
+
+
+@pytest.fixture
+def make_stand(
+    make_site: Callable[..., EkoStandSite],
+) -> Callable[..., EkoStand]:
+    """Return a factory for a single-part stand on a ``make_site`` site.
+
+    The part is ``cls(20.0, 1000.0, 50.0)``; site keyword arguments are passed
+    through, with ``H100_Spruce`` defaulting to 24 m.
+    """
+
+    def _make_stand(cls: type = EkoSpruce, **site_kwargs) -> EkoStand:
+        site = make_site(**{"H100_Spruce": 24.0, **site_kwargs})
+        return EkoStand([cls(20.0, 1000.0, 50.0)], site)
+
+    return _make_stand
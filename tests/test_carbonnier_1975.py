@@ -0,0 +1,80 @@
+"""Tests for the Carbonnier (1975) beech height model."""
+
+from __future__ import annotations
+
+import bisect
+
+import pytest
+
+from eko1985.carbonnier_1975 import CarbonnierHeightModel
+
+AGES = [float(age) for age in range(5, 135, 5)]
+A_VALS = [0.2 * age - 0.0004 * age**2 for age in AGES]
+B_VALS = [0.004 * age + 0.00002 * age**2 for age in AGES]
+UNEVEN_AGES = [5.0, 10.0, 20.0, 35.0, 50.0, 70.0, 100.0, 130.0]
+
+
+def _model(ages: list[float] = AGES) -> CarbonnierHeightModel:
+    b_by_age = dict(zip(AGES, B_VALS, strict=True))
+    a_by_age = dict(zip(AGES, A_VALS, strict=True))
+    return CarbonnierHeightModel(
+        ages, [a_by_age[age] for age in ages], [b_by_age[age] for age in ages]
+    )
+
+
+def _baseline_height(
+    model: CarbonnierHeightModel, age: float, site_index: float
+) -> float:
+    # The original lookup: exact match first, then bisect and interpolate
+    ages = list(model.ages)
+    i = ages.index(100.0)
+    tau = (site_index - model.a_vals[i]) / model.b_vals[i]
+    if age in ages:
+        i = ages.index(age)
+        return model.a_vals[i] + tau * model.b_vals[i]
+    i = bisect.bisect_left(ages, age)
+    if i == 0 or i == len(ages):
+        raise ValueError(f"Age {age} outside coefficient range")
+    h_lo = model.a_vals[i - 1] + tau * model.b_vals[i - 1]
+    h_hi = model.a_vals[i] + tau * model.b_vals[i]
+    w = (age - ages[i - 1]) / (ages[i] - ages[i - 1])
+    return h_lo + w * (h_hi - h_lo)
+
+
+@pytest.mark.parametrize("ages", [AGES, UNEVEN_AGES])
+@pytest.mark.parametrize("site_index", [18.0, 26.5, 34.0])
+def test_height_matches_baseline_on_and_between_grid_points(
+    ages: list[float], site_index: float
+) -> None:
+    model = _model(ages)
+    grid = [age / 4 for age in range(20, 521)]
+
+    for age in grid:
+        assert model.height_from_SI(age, site_index) == _baseline_height(
+            model, age, site_index
+        )
+
+
+@pytest.mark.parametrize("ages", [AGES, UNEVEN_AGES])
+@pytest.mark.parametrize("age", [0.0, 4.999, 130.001, 200.0, float("nan")])
+def test_height_outside_grid_raises(ages: list[float], age: float) -> None:
+    model = _model(ages)
+
+    with pytest.raises(ValueError, match="outside coefficient range"):
+        model.height_from_SI(age, 26.0)
+
+
+def test_untabulated_age_without_interpolation_raises() -> None:
+    model = _model()
+    tau = model._tau_from_SI(26.0)
+
+    assert model._height_at_age(50.0, tau, interpolate=False) == (
+        _baseline_height(model, 50.0, 26.0)
+    )
+    with pytest.raises(ValueError, match="interpolate=False"):
+        model._height_at_age(52.5, tau, interpolate=False)
+
+
+def test_unknown_reference_age_raises() -> None:
+    with pytest.raises(ValueError, match="not found in ages grid"):
+        _model().height_from_SI(50.0, 26.0, si_age=101.0)
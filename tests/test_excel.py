@@ -0,0 +1,173 @@
+"""Tests for the Excel ingest helpers."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+from zipfile import ZIP_STORED, ZipFile
+
+import pytest
+
+from eko1985 import excel
+from eko1985.excel import excel_to_json
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+WORKBOOK = REPO_ROOT / "assets" / "Output2.xlsx"
+OTHER_WORKBOOK = REPO_ROOT / "assets" / "Output3.xlsx"
+# Latitude cell of WORKBOOK's 'Site Variables' sheet
+LATITUDE_CELL = '<c r="E3"><v>56</v></c>'
+# WORKBOOK's 'Oversight' sheet
+OVERSIGHT_SHEET = "xl/worksheets/sheet2.xml"
+
+
+def _write_with_latitude(target: Path, latitude: int) -> None:
+    """Copy WORKBOOK uncompressed to ``target`` with a two-digit latitude."""
+
+    with ZipFile(WORKBOOK) as src, ZipFile(target, "w", ZIP_STORED) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "xl/worksheets/sheet3.xml":
+                cell = LATITUDE_CELL.replace("56", str(latitude))
+                data = data.replace(LATITUDE_CELL.encode(), cell.encode())
+            info.compress_type = ZIP_STORED
+            dst.writestr(info, data)
+
+
+def _write_with_oversight(target: Path, data: bytes) -> None:
+    """Copy WORKBOOK to ``target`` with ``data`` as its 'Oversight' sheet."""
+
+    with ZipFile(WORKBOOK) as src, ZipFile(target, "w") as dst:
+        for info in src.infolist():
+            dst.writestr(
+                info, data if info.filename == OVERSIGHT_SHEET else src.read(info)
+            )
+
+
+def test_excel_to_json_cache_round_trip(tmp_path: Path) -> None:
+    fresh = excel_to_json(str(WORKBOOK))
+
+    first = excel_to_json(str(WORKBOOK), cache_dir=tmp_path)
+    cached_files = list(tmp_path.glob("Output2.xlsx.*.json"))
+    assert len(cached_files) == 1
+
+    second = excel_to_json(str(WORKBOOK), cache_dir=tmp_path)
+    assert first == fresh
+    assert second == fresh
+
+
+def test_excel_to_json_returns_independent_copies() -> None:
+    first = excel_to_json(str(WORKBOOK))
+    first["events"].clear()
+    first["site"]["H100"]["Tall"] = -1.0
+
+    second = excel_to_json(str(WORKBOOK))
+    assert second["events"]
+    assert second["site"]["H100"].get("Tall") != -1.0
+
+
+def test_excel_to_json_cache_follows_workbook_changes(tmp_path: Path) -> None:
+    workbook = tmp_path / "book.xlsx"
+    cache_dir = tmp_path / "cache"
+    shutil.copyfile(WORKBOOK, workbook)
+    first = excel_to_json(str(workbook), cache_dir=cache_dir)
+
+    shutil.copyfile(OTHER_WORKBOOK, workbook)
+    second = excel_to_json(str(workbook), cache_dir=cache_dir)
+
+    other = excel_to_json(str(OTHER_WORKBOOK))
+    assert second["site"] == other["site"]
+    assert second["events"] == other["events"]
+    assert second != first
+    assert len(list(cache_dir.glob("book.xlsx.*.json"))) == 2
+
+
+def test_excel_to_json_ignores_unusable_cache_dir(tmp_path: Path) -> None:
+    # A regular file where the cache directory should be: mkdir fails
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("occupied", encoding="utf-8")
+
+    result = excel_to_json(str(WORKBOOK), cache_dir=not_a_dir)
+
+    assert result == excel_to_json(str(WORKBOOK))
+    assert not_a_dir.read_text(encoding="utf-8") == "occupied"
+
+
+def test_excel_to_json_cleans_up_failed_cache_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def replace_fails(src: object, dst: object) -> None:
+        raise OSError("no space left on device")
+
+    monkeypatch.setattr(excel.os, "replace", replace_fails)
+
+    result = excel_to_json(str(WORKBOOK), cache_dir=tmp_path)
+
+    assert result == excel_to_json(str(WORKBOOK))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_excel_to_json_skips_cache_when_serialising_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    def dumps_fails(obj: object, **kwargs: object) -> str:
+        raise TypeError("Type is not JSON serializable")
+
+    if use_orjson:
+        monkeypatch.setattr(excel, "orjson", SimpleNamespace(dumps=dumps_fails))
+    else:
+        monkeypatch.setattr(excel, "orjson", None)
+        monkeypatch.setattr(excel.json, "dumps", dumps_fails)
+
+    result = excel_to_json(str(WORKBOOK), cache_dir=tmp_path)
+
+    assert result == excel_to_json(str(WORKBOOK))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_excel_to_json_rereads_same_size_rewrite(tmp_path: Path) -> None:
+    workbook = tmp_path / "book.xlsx"
+    _write_with_latitude(workbook, 56)
+    assert excel_to_json(str(workbook))["site"]["latitude"] == 56.0
+    before = workbook.stat()
+
+    # Same size and, after restoring it, the same mtime as the first file
+    _write_with_latitude(workbook, 57)
+    os.utime(workbook, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert workbook.stat().st_size == before.st_size
+
+    assert excel_to_json(str(workbook))["site"]["latitude"] == 57.0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1.5, 1.5),
+        (float("nan"), None),
+        (None, None),
+        (3, 3.0),
+        ("2,5", 2.5),
+        ("n/a", None),
+    ],
+)
+def test_to_num(value: object, expected: float | None) -> None:
+    assert excel._to_num(value) == expected
+
+
+def test_excel_to_json_ignores_a_malformed_oversight_sheet(tmp_path: Path) -> None:
+    # Unreadable Oversight removals fall back to the General sheet's columns,
+    # exactly as for an Oversight sheet without any removal blocks
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "malformed").mkdir()
+    empty = tmp_path / "empty" / "book.xlsx"
+    malformed = tmp_path / "malformed" / "book.xlsx"
+    _write_with_oversight(
+        empty,
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+        b'main"><sheetData/></worksheet>',
+    )
+    _write_with_oversight(malformed, b"<worksheet><sheetData>")
+
+    assert excel_to_json(str(malformed)) == excel_to_json(str(empty))
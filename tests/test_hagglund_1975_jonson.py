@@ -0,0 +1,97 @@
+"""Tests for the Hägglund (1975) Jonson site-class curves."""
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+from eko1985.hagglund_1975_jonson import (
+    _PINE_NORTHERN_A,
+    _PINE_SOUTHERN_A,
+    _SPRUCE_NORTHERN_A,
+    _SPRUCE_SOUTHERN_A,
+    jonson_bonitet_pine_northern_Sweden,
+    jonson_bonitet_pine_southern_Sweden,
+    jonson_bonitet_spruce_northern_Sweden,
+    jonson_bonitet_spruce_southern_Sweden,
+)
+
+# (function, heights by jonsbon, pivot age, source coefficients on d - |d| and
+# d + |d|, age range of the reference material)
+SOURCE_CURVES = [
+    (
+        jonson_bonitet_pine_northern_Sweden,
+        _PINE_NORTHERN_A,
+        45,
+        0.06506,
+        0.01504,
+        (30, 130),
+    ),
+    (
+        jonson_bonitet_pine_southern_Sweden,
+        _PINE_SOUTHERN_A,
+        45,
+        0.0,
+        0.02440,
+        (30, 110),
+    ),
+    (
+        jonson_bonitet_spruce_northern_Sweden,
+        _SPRUCE_NORTHERN_A,
+        60,
+        0.0,
+        0.02788,
+        (40, 130),
+    ),
+    (
+        jonson_bonitet_spruce_southern_Sweden,
+        _SPRUCE_SOUTHERN_A,
+        45,
+        0.05008,
+        0.03668,
+        (40, 100),
+    ),
+]
+CURVE_FIELDS = ("curve", "heights", "pivot", "c1", "c2", "ages")
+
+
+@pytest.mark.parametrize(CURVE_FIELDS, SOURCE_CURVES)
+def test_heights_follow_the_source_curves(
+    curve, heights: dict, pivot: int, c1: float, c2: float, ages: tuple[int, int]
+) -> None:
+    for jonsbon, a in heights.items():
+        for age in range(ages[0], ages[1] + 1, 5):
+            d = age - pivot
+            expected = a + c1 * (d - abs(d)) - c2 * (d + abs(d))
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert curve(jonsbon, float(age)) == expected
+
+
+@pytest.mark.parametrize(CURVE_FIELDS, SOURCE_CURVES)
+def test_heights_warn_outside_the_material(
+    curve, heights: dict, pivot: int, c1: float, c2: float, ages: tuple[int, int]
+) -> None:
+    min_age, max_age = ages
+    for age in (min_age - 5.0, max_age + 5.0):
+        with pytest.warns(UserWarning, match=rf"\({min_age}-{max_age}\)"):
+            curve(min(heights), age)
+
+
+@pytest.mark.parametrize(CURVE_FIELDS, SOURCE_CURVES)
+def test_heights_reject_unknown_classes(
+    curve, heights: dict, pivot: int, c1: float, c2: float, ages: tuple[int, int]
+) -> None:
+    match = rf"Invalid Jonsbon \({min(heights)}-{max(heights)}\)"
+    with pytest.raises(ValueError, match=match):
+        curve(max(heights) + 1, float(pivot))
+
+
+@pytest.mark.parametrize("age", [40.0, 45.0, 60.0, 100.0])
+def test_southern_spruce_class_one(age: float) -> None:
+    # The source curve, with the 33.40 m height of class 1 at age 45
+    d = age - 45
+    expected = 33.40 + 0.05008 * (d - abs(d)) - 0.03668 * (d + abs(d))
+
+    assert jonson_bonitet_spruce_southern_Sweden(1, age) == expected
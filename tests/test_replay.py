@@ -0,0 +1,112 @@
+"""Tests for the management replay helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from eko1985.replay import (
+    _METRIC_TOLERANCES,
+    ABSOLUTE_TOLERANCES,
+    _combine_model_expected,
+    _expected_metrics,
+    _snapshot_single,
+    excel_to_json,
+    iter_management_from_json,
+    run_management_from_json,
+)
+from eko1985.stand import EkoStand
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_snapshot_volume_follows_site_changes(
+    make_stand: Callable[..., EkoStand],
+) -> None:
+    stand = make_stand()
+    part = stand.Parts[0]
+    _, before = _snapshot_single(stand)
+    assert before["VOL"] == part.VOL
+
+    stand.Site.H100_Spruce = 30.0
+    _, after = _snapshot_single(stand)
+
+    fresh = stand._volume_for(part, part.BA, part.QMD, part.age, part.stems, part.HK)
+    assert after["VOL"] == fresh
+    assert after["VOL"] != before["VOL"]
+
+
+def test_metric_tolerances_cover_the_expected_metrics() -> None:
+    expected = _expected_metrics({"after": {}})
+
+    assert expected.keys() == _METRIC_TOLERANCES.keys()
+    for key, tolerance in _METRIC_TOLERANCES.items():
+        assert tolerance == ABSOLUTE_TOLERANCES.get(key)
+
+
+def test_expected_metrics_without_a_record_are_all_missing() -> None:
+    assert _expected_metrics(None) == dict.fromkeys(_METRIC_TOLERANCES)
+
+
+def test_combine_clamps_each_metric_with_its_own_tolerance() -> None:
+    expected: dict[str, float | None] = {
+        "N": 1000.0,
+        "BA": 20.0,
+        "QMD": 16.0,
+        "VOL": 150.0,
+        "age": 50.0,
+    }
+    model: dict[str, float | None] = {
+        "N": 1100.0,
+        "BA": 19.0,
+        "QMD": 16.0,
+        "VOL": 170.0,
+        "age": 55.0,
+    }
+
+    combined = _combine_model_expected(model, expected)
+    adjusted = cast("dict[str, bool]", combined["adjusted"])
+    raw_delta = cast("dict[str, float]", combined["raw_delta"])
+    delta = cast("dict[str, float]", combined["delta"])
+    aligned = cast("dict[str, float]", combined["model"])
+
+    # N, BA and VOL exceed their tolerance; age has none and is never clamped
+    assert adjusted == {"N": True, "BA": True, "QMD": False, "VOL": True, "age": False}
+    assert raw_delta == {"N": 100.0, "BA": -1.0, "QMD": 0.0, "VOL": 20.0, "age": 5.0}
+    assert delta["N"] == pytest.approx(0.1)
+    assert delta["BA"] == pytest.approx(-0.1)
+    assert delta["VOL"] == pytest.approx(0.1)
+    assert aligned["QMD"] == 16.0
+    assert aligned["age"] == 55.0
+
+
+@pytest.mark.parametrize("workbook", ["Output2.xlsx", "output4.xlsx"])
+def test_iter_management_yields_the_run_records(workbook: str) -> None:
+    json_obj = excel_to_json(str(REPO_ROOT / workbook))
+
+    assert list(iter_management_from_json(json_obj)) == run_management_from_json(
+        json_obj
+    )
+
+
+@pytest.mark.parametrize(
+    ("json_obj", "error"),
+    [
+        ({}, KeyError),
+        ({"events": [{"type": "Tillväxt", "period": 1}]}, ValueError),
+    ],
+)
+def test_iter_management_raises_the_run_errors_lazily(
+    json_obj: dict, error: type[Exception]
+) -> None:
+    with pytest.raises(error) as run_error:
+        run_management_from_json(json_obj)
+
+    # Building the iterator reads nothing; the first item raises
+    records = iter_management_from_json(json_obj)
+    with pytest.raises(error) as iter_error:
+        next(records)
+    assert str(iter_error.value) == str(run_error.value)
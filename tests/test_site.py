@@ -0,0 +1,83 @@
+"""Tests for the site description."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+
+import pytest
+
+from eko1985.site import EkoStandSite
+from eko1985.species import EkoPine
+from eko1985.stand import EkoStand
+
+SiteFactory = Callable[..., EkoStandSite]
+
+
+def test_site_index_in_dm_follows_construction(make_site: SiteFactory) -> None:
+    site = make_site(H100_Spruce=24.0)
+
+    assert site.SIdm_spruce == 240.0
+    assert site.H100_Pine is not None
+    assert site.SIdm_pine == pytest.approx(site.H100_Pine * 10)
+
+
+@pytest.mark.parametrize(
+    ("attribute", "dm_attribute"),
+    [("H100_Spruce", "SIdm_spruce"), ("H100_Pine", "SIdm_pine")],
+)
+def test_h100_assignment_updates_site_index_in_dm(
+    make_site: SiteFactory, attribute: str, dm_attribute: str
+) -> None:
+    site = make_site(H100_Spruce=24.0, H100_Pine=22.0)
+
+    setattr(site, attribute, 27.5)
+    assert getattr(site, dm_attribute) == 275.0
+
+    setattr(site, attribute, None)
+    assert getattr(site, attribute) is None
+    assert getattr(site, dm_attribute) == 0.0
+
+
+def test_refresh_after_h100_assignment_uses_the_new_site_index(
+    make_site: SiteFactory,
+) -> None:
+    site = make_site(H100_Spruce=24.0, H100_Pine=22.0)
+    stand = EkoStand([EkoPine(20.0, 1000.0, 50.0)], site)
+    part = stand.Parts[0]
+    before = part.VOL
+
+    site.H100_Pine = 26.0
+    stand._refresh_competition_vars()
+
+    # Same volume as a stand built on that site index from the start
+    fresh = EkoStand(
+        [EkoPine(20.0, 1000.0, 50.0)], make_site(H100_Spruce=24.0, H100_Pine=26.0)
+    )
+    assert part.VOL == fresh.Parts[0].VOL
+    assert part.VOL != before
+    assert part.HK == fresh.Parts[0].HK
+
+
+def _slot_values(site: EkoStandSite) -> dict[str, object]:
+    return {name: getattr(site, name) for name in EkoStandSite.__slots__}
+
+
+@pytest.mark.parametrize("make_clone", [EkoStandSite.clone, copy.copy])
+def test_clone_is_independent_of_the_template(
+    make_site: SiteFactory, make_clone
+) -> None:
+    template = make_site(H100_Spruce=24.0)
+    snapshot = _slot_values(template)
+
+    clone = make_clone(template)
+    assert clone is not template
+    assert _slot_values(clone) == snapshot
+
+    clone.thinned = True
+    clone.thinned_5y = True
+    clone.H100_Spruce = 30.0
+    clone.H100_Pine = 28.0
+
+    assert _slot_values(template) == snapshot
+    assert clone.SIdm_spruce == 300.0
@@ -0,0 +1,126 @@
+"""Tests for the stand container's derived-metric refresh."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+
+import pytest
+
+from eko1985.site import EkoStandSite
+from eko1985.species import EkoBirch, EkoPine, EkoSpruce
+from eko1985.stand import EkoStand
+
+# Species built from (BA, stems, age) alone in these tests
+Species = type[EkoBirch | EkoPine | EkoSpruce]
+StandFactory = Callable[..., EkoStand]
+
+
+def _fresh_volume(stand: EkoStand) -> float:
+    part = stand.Parts[0]
+    return part.getVolume(
+        BA=part.BA, QMD=part.QMD, age=part.age, stems=part.stems, HK=part.HK
+    )
+
+
+@pytest.mark.parametrize(
+    ("cls", "region", "attribute", "value"),
+    [
+        (EkoSpruce, "South", "H100_Spruce", 30.0),
+        (EkoSpruce, "South", "region", "North"),
+        (EkoSpruce, "South", "thinned", True),
+        (EkoSpruce, "Central", "HerbsGrassesNoFieldLayer", True),
+        (EkoBirch, "Central", "latitude", 64.0),
+        (EkoBirch, "Central", "altitude", 400.0),
+    ],
+)
+def test_refresh_picks_up_site_changes(
+    make_stand: StandFactory,
+    cls: Species,
+    region: str,
+    attribute: str,
+    value: object,
+) -> None:
+    stand = make_stand(cls, region=region)
+    before = stand.Parts[0].VOL
+
+    setattr(stand.Site, attribute, value)
+    stand._refresh_competition_vars()
+
+    assert stand.Parts[0].VOL == _fresh_volume(stand)
+    assert stand.Parts[0].VOL != before
+
+
+def test_refresh_after_h100_reassignment_updates_volume(
+    make_stand: StandFactory,
+) -> None:
+    stand = make_stand()
+    stale = stand.Parts[0].VOL
+
+    stand.Site.H100_Spruce = 30.0
+    stand._refresh_competition_vars()
+
+    assert stand.Site.SIdm_spruce == 300.0
+    assert stand.Parts[0].VOL == pytest.approx(189.355, abs=1e-3)
+    assert stand.Parts[0].VOL != stale
+    assert stand.StandVOL == stand.Parts[0].VOL
+
+
+def test_refresh_without_changes_keeps_volume(make_stand: StandFactory) -> None:
+    stand = make_stand()
+    before = stand.Parts[0].VOL
+
+    stand._refresh_competition_vars()
+
+    assert stand.Parts[0].VOL == before
+
+
+def test_competition_sums_other_parts_in_part_order(
+    make_site: Callable[..., EkoStandSite],
+) -> None:
+    # 8.1 + 15.6 differs in the last bit from (8.1 + 15.6 + 12.4) - 12.4
+    site = make_site(H100_Spruce=24.0)
+    parts = [
+        EkoSpruce(8.1, 600.0, 50.0),
+        EkoPine(15.6, 900.0, 50.0),
+        EkoBirch(12.4, 700.0, 50.0),
+    ]
+    stand = EkoStand(parts, site)
+
+    for p in parts:
+        BA_other = N_other = 0.0
+        for q in parts:
+            if q is not p:
+                BA_other += q.BA
+                N_other += q.stems
+        assert p.BAOtherSpecies == BA_other
+        assert p.QMDOtherSpecies == stand.getQMD(BA_other, N_other)
+    assert parts[2].BAOtherSpecies == 8.1 + 15.6
+
+
+def test_volume_of_a_copied_part_uses_the_copy(make_stand: StandFactory) -> None:
+    stand = make_stand()
+    other = make_stand(H100_Spruce=30.0)
+    clone = copy.copy(stand.Parts[0])
+    clone.stand = other
+
+    volume = other._volume_for(
+        clone, clone.BA, clone.QMD, clone.age, clone.stems, clone.HK
+    )
+
+    assert volume == clone.getVolume(
+        BA=clone.BA, QMD=clone.QMD, age=clone.age, stems=clone.stems, HK=clone.HK
+    )
+    assert volume != stand.Parts[0].VOL
+
+
+def test_refresh_uses_a_getvolume_patched_after_registration(
+    make_stand: StandFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stand = make_stand()
+
+    monkeypatch.setattr(EkoSpruce, "getVolume", lambda self, **kwargs: 123.0)
+    stand._refresh_competition_vars()
+
+    assert stand.Parts[0].VOL == 123.0
+    assert stand.StandVOL == 123.0
@@ -0,0 +1,25 @@
+"""Tests for the replay plotting helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from eko1985.visualize import DEFAULT_WORKBOOKS, _replay_workbooks
+
+
+def test_parallel_replay_matches_serial_replay(tmp_path: Path) -> None:
+    workbooks = [path for path in DEFAULT_WORKBOOKS if path.exists()]
+    assert len(workbooks) > 1
+
+    serial = _replay_workbooks(workbooks, jobs=1)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    parallel = _replay_workbooks(workbooks, cache_dir=cache_dir, jobs=2)
+
+    assert parallel == serial
+    cached = sorted(entry.name.split(".")[0] for entry in cache_dir.iterdir())
+    assert cached == sorted(path.stem for path in workbooks)